@@ -0,0 +1,21 @@
+-- Migration 017: Add dedup blocking key to scholarships
+-- Purpose: Let duplicate detection fuzzy-compare a new scholarship only against
+-- rows in the same block (organization prefix + award bucket) instead of
+-- scanning the whole table on every insert.
+-- Dependencies: 012_add_scholarships_tables.sql
+
+-- Block key: first three characters of the lowercased organization, then the
+-- min_award bucket in $1,000 steps, e.g. 'tec|5'. Clients that want to probe a
+-- block must build the key with the same rules.
+ALTER TABLE public.scholarships
+  ADD COLUMN IF NOT EXISTS checksum_block VARCHAR(20)
+  GENERATED ALWAYS AS (
+    substr(lower(coalesce(organization, '')), 1, 3)
+      || '|'
+      || coalesce(floor(min_award / 1000)::int::text, '')
+  ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_scholarships_checksum_block ON public.scholarships(checksum_block);
+
+COMMENT ON COLUMN public.scholarships.checksum_block IS
+  'Dedup blocking key: lower(organization) prefix + min_award bucket. Fuzzy matching only compares rows within a block.';
@@ -0,0 +1,15 @@
+-- Migration 018: Add normalized scholarship name
+-- Purpose: Store a lowercased, punctuation-free copy of the name once per row so
+-- duplicate detection doesn't re-normalize every candidate name per comparison.
+-- Dependencies: 012_add_scholarships_tables.sql
+
+-- Lowercase first, then strip everything except letters, digits and spaces.
+-- Clients comparing against this column must normalize their input the same way.
+ALTER TABLE public.scholarships
+  ADD COLUMN IF NOT EXISTS name_normalized VARCHAR(500)
+  GENERATED ALWAYS AS (
+    regexp_replace(lower(name), '[^a-z0-9 ]', '', 'g')
+  ) STORED;
+
+COMMENT ON COLUMN public.scholarships.name_normalized IS
+  'lower(name) with everything but [a-z0-9 ] removed; used for duplicate matching';
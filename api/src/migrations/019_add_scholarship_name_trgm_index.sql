@@ -0,0 +1,21 @@
+-- Migration 019: Trigram index for fuzzy scholarship name matching
+-- Purpose: Let Postgres return only near-duplicate names (pg_trgm similarity)
+-- instead of shipping every candidate row to the client for fuzzy matching.
+-- Dependencies: 018_add_scholarship_name_normalized.sql
+
+-- Installed into the extensions schema (not public), per Supabase's guidance
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA extensions;
+
+CREATE INDEX IF NOT EXISTS idx_scholarships_name_normalized_trgm
+  ON public.scholarships USING gin (name_normalized extensions.gin_trgm_ops);
+
+-- Example shortlist query (the % operator uses pg_trgm.similarity_threshold,
+-- default 0.3; raise it per session with SET pg_trgm.similarity_threshold = 0.5).
+-- The operator resolves unqualified because Supabase's default search_path
+-- includes the extensions schema:
+--
+-- SELECT id, name, extensions.similarity(name_normalized, $1) AS score
+-- FROM scholarships
+-- WHERE name_normalized % $1
+-- ORDER BY score DESC
+-- LIMIT 5;
@@ -0,0 +1,13 @@
+-- Migration 020: Partial index for duplicate checks on active scholarships
+-- Purpose: Duplicate detection only compares against active scholarships. A
+-- partial index keeps expired, archived and invalid rows out of the index
+-- entirely, so the lookup stays small as dead scholarships accumulate.
+-- Dependencies: 012_add_scholarships_tables.sql
+
+-- Queries must repeat the predicate to use this index, e.g.
+--   WHERE lower(name) = lower($1) AND lower(organization) = lower($2)
+--     AND status = 'active'
+-- URL lookups are already served by the unique_scholarship_url index.
+CREATE INDEX IF NOT EXISTS idx_scholarships_active_name_org
+  ON public.scholarships (lower(name), lower(organization))
+  WHERE status = 'active';
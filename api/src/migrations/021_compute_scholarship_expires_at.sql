@@ -0,0 +1,38 @@
+-- Migration 021: Compute scholarships.expires_at in the database
+-- Purpose: expires_at is always deadline + 30 days grace period. Deriving it in
+-- a trigger keeps every writer consistent without each client recomputing it.
+-- Lookups on expires_at are served by idx_scholarships_expires_at (migration 012).
+-- Dependencies: 012_add_scholarships_tables.sql
+
+-- A trigger (rather than a GENERATED column) so existing writers that still
+-- send expires_at keep working; their value is simply overwritten.
+-- Rows without a deadline (rolling/varies) get a NULL expires_at, including
+-- when an UPDATE clears the deadline, so no stale expiry outlives the deadline.
+CREATE OR REPLACE FUNCTION set_scholarship_expires_at()
+RETURNS TRIGGER AS $$
+BEGIN
+  NEW.expires_at := NEW.deadline + INTERVAL '30 days';
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS set_scholarships_expires_at ON public.scholarships;
+
+CREATE TRIGGER set_scholarships_expires_at
+  BEFORE INSERT OR UPDATE OF deadline, expires_at ON public.scholarships
+  FOR EACH ROW
+  EXECUTE FUNCTION set_scholarship_expires_at();
+
+-- Backfill rows whose expires_at doesn't match their deadline. The updated_at
+-- trigger is disabled around the statement so the backfill doesn't reset
+-- updated_at, which the finder uses to decide when expired rows get archived.
+ALTER TABLE public.scholarships DISABLE TRIGGER update_scholarships_updated_at;
+
+UPDATE public.scholarships
+SET expires_at = deadline + INTERVAL '30 days'
+WHERE expires_at IS DISTINCT FROM deadline + INTERVAL '30 days';
+
+ALTER TABLE public.scholarships ENABLE TRIGGER update_scholarships_updated_at;
+
+COMMENT ON COLUMN public.scholarships.expires_at IS
+  'deadline + 30 days, maintained by the set_scholarships_expires_at trigger';
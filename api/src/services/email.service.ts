@@ -468,13 +468,7 @@ function generateCollaboratorOverdueEmail(params: SendCollaborationReminderParam
   const escapedStudent = studentName ? he.encode(studentName) : 'a student';
   const escapedApplication = applicationName ? he.encode(applicationName) : '';
 
-  const formattedDate = he.encode(
-    new Date(dueDate).toLocaleDateString('en-US', {
-      year: 'numeric',
-      month: 'long',
-      day: 'numeric',
-    })
-  );
+  const formattedDate = he.encode(formatDateNoTimezone(dueDate));
 
   const daysOverdue = Math.abs(daysUntilDue);
   const overdueText = daysOverdue === 1 ? '1 day ago' : `${daysOverdue} days ago`;
@@ -42,14 +42,16 @@ const REMINDER_CONFIG: Record<'application' | 'collaboration', ReminderConfig> =
  * @param dueDate The due date
  * @param lastReminderSent When the last reminder was sent (null if never sent)
  * @param intervals Array of day intervals to check
+ * @param now Reference time for the current run (computed once by the caller;
+ *            last_reminder_sent_at is recorded with the same value)
  * @returns true if a reminder should be sent
  */
 function shouldSendReminder(
   dueDate: Date,
   lastReminderSent: Date | null,
-  intervals: number[]
+  intervals: number[],
+  now: Date
 ): boolean {
-  const now = new Date();
   const daysDiff = Math.floor((dueDate.getTime() - now.getTime()) / (1000 * 60 * 60 * 24));
 
   // Check if we're at one of the reminder intervals
@@ -157,7 +159,7 @@ async function processApplicationReminders(): Promise<number> {
           : null;
 
         // Check if we should send a reminder
-        if (shouldSendReminder(dueDate, lastReminderSent, intervals)) {
+        if (shouldSendReminder(dueDate, lastReminderSent, intervals, now)) {
           // Send reminder email
           const userProfile = app.user_profiles as any;
           const emailSent = await emailService.sendApplicationReminder({
@@ -178,7 +180,7 @@ async function processApplicationReminders(): Promise<number> {
             try {
               await supabase
                 .from('applications')
-                .update({ last_reminder_sent_at: new Date().toISOString() })
+                .update({ last_reminder_sent_at: now.toISOString() })
                 .eq('id', app.id);
 
               console.log(`[reminders.service] Updated last_reminder_sent_at for application ${app.id}`);
@@ -308,7 +310,7 @@ async function processCollaborationReminders(): Promise<number> {
           : null;
 
         // Check if we should send a reminder
-        if (shouldSendReminder(dueDate, lastReminderSent, intervals)) {
+        if (shouldSendReminder(dueDate, lastReminderSent, intervals, now)) {
           // Send reminder email to collaborator
           const collaborator = collab.collaborators as any;
           const application = collab.applications as any;
@@ -334,7 +336,7 @@ async function processCollaborationReminders(): Promise<number> {
             try {
               await supabase
                 .from('collaborations')
-                .update({ last_reminder_sent_at: new Date().toISOString() })
+                .update({ last_reminder_sent_at: now.toISOString() })
                 .eq('id', collab.id);
 
               console.log(`[reminders.service] Updated last_reminder_sent_at for collaboration ${collab.id}`);
@@ -2,18 +2,22 @@
  * Utility functions for converting between snake_case (database) and camelCase (TypeScript)
  */
 
+// Compiled once at module load; these run for every key of every row we map
+const SNAKE_SEGMENT_RE = /_([a-z])/g;
+const UPPERCASE_LETTER_RE = /[A-Z]/g;
+
 /**
  * Convert a string from snake_case to camelCase
  */
 function snakeToCamel(str: string): string {
-  return str.replace(/_([a-z])/g, (_, letter) => letter.toUpperCase());
+  return str.replace(SNAKE_SEGMENT_RE, (_, letter) => letter.toUpperCase());
 }
 
 /**
  * Convert a string from camelCase to snake_case
  */
 function camelToSnake(str: string): string {
-  return str.replace(/[A-Z]/g, letter => `_${letter.toLowerCase()}`);
+  return str.replace(UPPERCASE_LETTER_RE, letter => `_${letter.toLowerCase()}`);
 }
 
 /**
@@ -30,11 +34,11 @@ export function toCamelCase<T = any>(obj: any): T {
   }
 
   if (typeof obj === 'object' && obj.constructor === Object) {
-    return Object.keys(obj).reduce((acc, key) => {
-      const camelKey = snakeToCamel(key);
-      acc[camelKey] = toCamelCase(obj[key]);
-      return acc;
-    }, {} as any) as T;
+    const result: any = {};
+    for (const key of Object.keys(obj)) {
+      result[snakeToCamel(key)] = toCamelCase(obj[key]);
+    }
+    return result as T;
   }
 
   return obj;
@@ -54,11 +58,11 @@ export function toSnakeCase<T = any>(obj: any): T {
   }
 
   if (typeof obj === 'object' && obj.constructor === Object) {
-    return Object.keys(obj).reduce((acc, key) => {
-      const snakeKey = camelToSnake(key);
-      acc[snakeKey] = toSnakeCase(obj[key]);
-      return acc;
-    }, {} as any) as T;
+    const result: any = {};
+    for (const key of Object.keys(obj)) {
+      result[camelToSnake(key)] = toSnakeCase(obj[key]);
+    }
+    return result as T;
   }
 
   return obj;
@@ -47,28 +47,34 @@ function DashboardCollaborations() {
         const applicationsData = await apiGet<ApplicationResponse[]>('/applications');
         setApplications(applicationsData || []);
 
-        // Fetch collaborations for each application
+        // Fetch collaborations for each application (requests are independent, so run them concurrently)
         const allCollaborations: CollaborationResponse[] = [];
         const collaboratorIds = new Set<number>();
 
-        for (const app of applicationsData || []) {
-          try {
-            const collabs = await apiGet<CollaborationResponse[]>(`/applications/${app.id}/collaborations`);
-            if (collabs) {
-              allCollaborations.push(...collabs);
-              // Collect collaborator IDs
-              collabs.forEach(collab => {
-                collaboratorIds.add(collab.collaboratorId);
-                // Check if collaborator data is embedded in response
-                const collabWithEmbedded = collab as CollaborationResponse & { collaborator?: CollaboratorResponse };
-                if (collabWithEmbedded.collaborator && collabWithEmbedded.collaborator.id) {
-                  collaboratorIds.delete(collabWithEmbedded.collaborator.id); // Will add from embedded data
-                }
-              });
+        const collabsPerApplication = await Promise.all(
+          (applicationsData || []).map(async (app) => {
+            try {
+              return await apiGet<CollaborationResponse[]>(`/applications/${app.id}/collaborations`);
+            } catch (err) {
+              // Continue if one application's collaborations fail to load
+              console.error(`Failed to load collaborations for application ${app.id}:`, err);
+              return null;
             }
-          } catch (err) {
-            // Continue if one application's collaborations fail to load
-            console.error(`Failed to load collaborations for application ${app.id}:`, err);
+          })
+        );
+
+        for (const collabs of collabsPerApplication) {
+          if (collabs) {
+            allCollaborations.push(...collabs);
+            // Collect collaborator IDs
+            collabs.forEach(collab => {
+              collaboratorIds.add(collab.collaboratorId);
+              // Check if collaborator data is embedded in response
+              const collabWithEmbedded = collab as CollaborationResponse & { collaborator?: CollaboratorResponse };
+              if (collabWithEmbedded.collaborator && collabWithEmbedded.collaborator.id) {
+                collaboratorIds.delete(collabWithEmbedded.collaborator.id); // Will add from embedded data
+              }
+            });
           }
         }
         setCollaborations(allCollaborations);
@@ -96,17 +102,20 @@ function DashboardCollaborations() {
           }
         });
 
-        // Then fetch any missing collaborators
-        for (const collabId of collaboratorIds) {
-          if (!collaboratorMap.has(collabId)) {
+        // Then fetch any missing collaborators (independent requests, run concurrently)
+        const missingCollaboratorIds = Array.from(collaboratorIds).filter(
+          (collabId) => !collaboratorMap.has(collabId)
+        );
+        await Promise.all(
+          missingCollaboratorIds.map(async (collabId) => {
             try {
               const collaboratorData = await apiGet<CollaboratorResponse>(`/collaborators/${collabId}`);
               collaboratorMap.set(collabId, collaboratorData);
             } catch (err) {
               console.error(`Failed to fetch collaborator ${collabId}:`, err);
             }
-          }
-        }
+          })
+        );
         setCollaborators(collaboratorMap);
       } catch (err) {
         const errorMessage = err instanceof Error ? err.message : 'Failed to load collaborations';